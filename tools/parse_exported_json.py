@@ -18,6 +18,30 @@ from pathlib import Path
 from typing import Dict, List, Any, Tuple, Optional
 from collections import defaultdict
 
+try:
+    import orjson  # Optional: much faster load/dump of large exports
+except ImportError:
+    orjson = None
+
+
+def load_json(path) -> Any:
+    """Load a JSON file, using orjson when available."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dump_json(data: Any, path) -> None:
+    """Write data as indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
 
 class ExportedJsonParser:
     def __init__(self, json_data: Dict):
@@ -25,6 +49,7 @@ class ExportedJsonParser:
         self.names = json_data.get("names", [])
         self.name_lookup = {i: name for i, name in enumerate(self.names)}
         self.exports = json_data.get("exports", [])
+        self._categories: Optional[Dict[str, List[str]]] = None
         
     def get_name(self, index: int) -> Optional[str]:
         """Get name from index."""
@@ -33,7 +58,10 @@ class ExportedJsonParser:
         return None
     
     def categorize_names(self) -> Dict[str, List[str]]:
-        """Categorize all names by their patterns."""
+        """Categorize all names by their patterns (computed once, then cached)."""
+        if self._categories is not None:
+            return self._categories
+        
         categories = defaultdict(list)
         
         for name in self.names:
@@ -85,7 +113,8 @@ class ExportedJsonParser:
             else:
                 categories["other"].append(name)
         
-        return dict(categories)
+        self._categories = dict(categories)
+        return self._categories
     
     def extract_colosseum_records(self) -> List[Dict]:
         """Extract Colosseum battle records."""
@@ -328,8 +357,7 @@ def process_file(input_path: str, output_path: str = None) -> Dict:
     """Process a single JSON file."""
     print(f"Processing: {input_path}")
     
-    with open(input_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_json(input_path)
     
     parser = ExportedJsonParser(data)
     result = parser.extract_all()
@@ -338,8 +366,7 @@ def process_file(input_path: str, output_path: str = None) -> Dict:
     if output_path is None:
         output_path = input_path.replace(".json", "_parsed.json")
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    dump_json(result, output_path)
     
     print(f"  Saved to: {output_path}")
     
@@ -381,11 +408,10 @@ def process_all_files(data_folder: str):
     
     # Save summary
     summary_path = folder / "_parse_summary.json"
-    with open(summary_path, 'w', encoding='utf-8') as f:
-        json.dump({
-            "files_processed": all_results,
-            "totals": consolidated["totals"]
-        }, f, indent=2)
+    dump_json({
+        "files_processed": all_results,
+        "totals": consolidated["totals"]
+    }, summary_path)
     
     print(f"Summary saved to: {summary_path}")
     print(f"\n=== TOTALS ===")
@@ -408,8 +434,7 @@ def consolidate_results(folder: Path) -> Dict:
     
     for pf in parsed_files:
         try:
-            with open(pf, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json(pf)
             
             for e in data.get("enemies", []):
                 all_enemies.add(e.get("enemy_id"))
@@ -461,8 +486,7 @@ def consolidate_results(folder: Path) -> Dict:
     }
     
     consolidated_path = folder / "_consolidated_data.json"
-    with open(consolidated_path, 'w', encoding='utf-8') as f:
-        json.dump(consolidated, f, indent=2, ensure_ascii=False)
+    dump_json(consolidated, consolidated_path)
     
     print(f"Consolidated data saved to: {consolidated_path}")
     
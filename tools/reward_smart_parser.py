@@ -12,6 +12,29 @@ Pattern observed:
 import json
 import struct
 import sys
+from bisect import bisect_right
+
+# int32 classification: value ranges split at these boundaries, one label per bucket.
+# The bool marks buckets worth printing even without a label (possible item IDs).
+VALUE_BOUNDARIES = (1, 100, 1000, 2000, 3000, 9000, 10000, 50000)
+VALUE_LABELS = (
+    ("(zero/padding)", True),                  # 0
+    ("(quantity?)", True),                     # 1-99
+    ("(ITEM ID? - consumable range)", True),   # 100-999
+    ("(name index or other)", True),           # 1000-1999
+    ("(ITEM ID? - armor range)", True),        # 2000-2999
+    ("", True),                                # 3000-8999
+    ("(ITEM ID? - accessory range)", True),    # 9000-9999
+    ("(ITEM ID? - materia range)", True),      # 10000-49999
+    ("", False),                               # 50000+
+)
+
+
+def classify_value(value):
+    """Return (description, show) for an int32 read from a reward entry."""
+    if value == 0xFFFFFFFF:
+        return "(separator -1)", True
+    return VALUE_LABELS[bisect_right(VALUE_BOUNDARIES, value)]
 
 def parse_rewards_smart(json_path, uasset_path):
     """Parse rewards with detailed binary analysis."""
@@ -27,11 +50,16 @@ def parse_rewards_smart(json_path, uasset_path):
     with open(uexp_path, 'rb') as f:
         binary_data = f.read()
     
+    binary_view = memoryview(binary_data)
+    
     print(f"Binary size: {len(binary_data):,} bytes")
     print(f"Name refs: {len(name_refs)}\n")
     
-    # Find all reward name references
-    reward_refs = [ref for ref in name_refs if ref['name'].startswith(('rwr', 'rwd'))]
+    # Find all reward name references (sorted so each entry ends where the next begins)
+    reward_refs = sorted(
+        (ref for ref in name_refs if ref['name'].startswith(('rwr', 'rwd'))),
+        key=lambda ref: ref['index']
+    )
     print(f"Found {len(reward_refs)} reward entries\n")
     
     # Analyze first few rewards in detail
@@ -51,39 +79,20 @@ def parse_rewards_smart(json_path, uasset_path):
         print(f"\n{i+1}. {reward_name}")
         print(f"   Offset: {start:6d}, Size: {size:4d} bytes")
         
-        # Show hex dump
-        hex_data = binary_data[start:start+min(80, size)]
-        hex_str = ' '.join(f'{b:02X}' for b in hex_data[:80])
+        # Show hex dump (memoryview slice avoids copying the window)
+        hex_str = binary_view[start:start+min(80, size)].hex(' ').upper()
         print(f"   Hex: {hex_str}")
         
-        # Try to parse int32 values
+        # Try to parse int32 values (one unpack call for the whole window)
         print(f"   Int32 values:")
-        for offset in range(0, min(80, size), 4):
-            if start + offset + 4 <= len(binary_data):
-                value = struct.unpack('<I', binary_data[start+offset:start+offset+4])[0]
-                
-                # Identify what this might be
-                if value == 0:
-                    desc = "(zero/padding)"
-                elif value == 0xFFFFFFFF:
-                    desc = "(separator -1)"
-                elif 100 <= value < 1000:
-                    desc = "(ITEM ID? - consumable range)"
-                elif 2000 <= value < 3000:
-                    desc = "(ITEM ID? - armor range)"
-                elif 9000 <= value < 10000:
-                    desc = "(ITEM ID? - accessory range)"
-                elif 10000 <= value < 50000:
-                    desc = "(ITEM ID? - materia range)"
-                elif 1 <= value <= 99:
-                    desc = "(quantity?)"
-                elif value < 2000:
-                    desc = "(name index or other)"
-                else:
-                    desc = ""
-                
-                if desc or (100 <= value < 50000):
-                    print(f"      +{offset:3d}: {value:8d} {desc}")
+        word_count = max(0, min((min(80, size) + 3) // 4, (len(binary_data) - start) // 4))
+        # unpack_from still checks the offset for a zero-length read, so a
+        # reference past EOF must skip the call
+        values = struct.unpack_from(f'<{word_count}I', binary_data, start) if word_count else ()
+        for word, value in enumerate(values):
+            desc, show = classify_value(value)
+            if show:
+                print(f"      +{word * 4:3d}: {value:8d} {desc}")
 
 if __name__ == '__main__':
     if len(sys.argv) < 3:
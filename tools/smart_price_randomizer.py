@@ -28,6 +28,9 @@ USAGE:
   Auto-deploy mode (randomize, repack, and install):
     python smart_price_randomizer.py <input.uexp> --auto-deploy <seed> <min> <max>
 
+  Dry run (report counts only, write nothing):
+    python smart_price_randomizer.py <input.uexp> --dry-run [output.uexp] [seed] [min] [max]
+
 EXAMPLES:
   # Manual: Create a randomized copy
   python smart_price_randomizer.py ShopItem.uexp ShopItem_mod.uexp 12345 100 5000
@@ -51,6 +54,8 @@ SEE ALSO:
   - EQUIPMENT_RANDOMIZATION_PLAN.md: Similar approach for equipment stats
 """
 
+import re
+import mmap
 import struct
 import random
 import sys
@@ -59,9 +64,19 @@ import shutil
 import subprocess
 import configparser
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+# An array count of 1-99 stored as a little-endian uint32: low byte 0x01-0x63, then
+# three zero bytes. Two matches can never overlap, so finditer sees every candidate.
+ARRAY_COUNT_PATTERN = re.compile(rb'[\x01-\x63]\x00\x00\x00')
+
+# One precompiled codec per possible array length, so a whole array is read or
+# written in one call
+PRICE_ARRAY_STRUCTS = [struct.Struct(f'<{count}I') for count in range(100)]
+
+
 def load_config():
     """Load configuration from config.ini or use defaults"""
     config = configparser.ConfigParser()
@@ -74,7 +89,7 @@ def load_config():
     }
     
     if config_path.exists():
-        config.read(config_path)
+        config.read(config_path, encoding='utf-8-sig')
         if 'Paths' in config:
             for key in defaults:
                 if key in config['Paths']:
@@ -89,106 +104,132 @@ def find_price_arrays(data, min_price=1, max_price=9999):
     Returns list of (offset, count, prices) tuples
     """
     arrays = []
-    i = 0
+    skip_until = 0
+    scan_end = len(data) - 4
     
     # Look for FF7ArrayProperty markers followed by price data
     # Pattern: Look for sequences of 4-byte integers in price range
-    while i < len(data) - 4:
-        # Try to read as little-endian 4-byte integer
-        value = struct.unpack('<I', data[i:i+4])[0]
+    # Only offsets holding a plausible count (1-99) can start an array, so let the
+    # regex engine find those in C instead of unpacking every byte offset
+    for match in ARRAY_COUNT_PATTERN.finditer(data):
+        i = match.start()
+        if i >= scan_end:
+            break
+        if i < skip_until:
+            continue  # Inside an array we already accepted
         
-        # Check if this could be an array count (small positive number)
-        if 0 < value < 100 and i + value * 4 < len(data):
-            # This might be an array count! Check if following values are prices
-            potential_count = value
-            prices = []
-            valid = True
-            
-            for j in range(potential_count):
-                price_offset = i + 4 + j * 4
-                if price_offset + 4 <= len(data):
-                    price = struct.unpack('<I', data[price_offset:price_offset+4])[0]
-                    
-                    # Check if it's in price range
-                    if min_price <= price <= max_price:
-                        prices.append(price)
-                    elif price == 0:
-                        # Zero prices are OK (not yet priced)
-                        prices.append(price)
-                    else:
-                        valid = False
-                        break
-                else:
-                    valid = False
-                    break
-            
-            # If we found a valid array
-            if valid and len(prices) >= 1 and len(prices) <= 100:
-                # Check if this looks like a real price array
-                # (at least some prices should be non-zero)
-                non_zero_prices = [p for p in prices if p > 0]
-                if len(non_zero_prices) >= len(prices) * 0.5:  # At least 50% non-zero
-                    arrays.append((i, potential_count, prices))
-                    i += 4 + potential_count * 4  # Skip past this array
-                    continue
+        # Little-endian count: the low byte is the value
+        value = data[i]
+        
+        # This might be an array count! Check if following values are prices
+        potential_count = value
+        if i + 4 + potential_count * 4 > len(data):
+            continue  # Not enough bytes left for the prices
+        prices = list(PRICE_ARRAY_STRUCTS[potential_count].unpack_from(data, i + 4))
         
-        i += 1
+        # Check if this looks like a real price array
+        # (at least some prices should be non-zero)
+        zeros = prices.count(0)
+        if (potential_count - zeros) * 2 < potential_count:  # At least 50% non-zero
+            continue
+        
+        # Zero prices are OK (not yet priced); every other price must be in range.
+        # With at least one non-zero price, max() is the largest non-zero price and
+        # the first non-zero entry in sorted order is the smallest
+        if max(prices) <= max_price and sorted(prices)[zeros] >= min_price:
+            arrays.append((i, potential_count, prices))
+            skip_until = i + 4 + potential_count * 4  # Skip past this array
     
     return arrays
 
 
-def randomize_prices_binary(input_path, output_path, seed, min_price=1, max_price=9999):
-    """Randomize prices in ShopItem.uexp using intelligent binary scanning"""
+def randomize_prices_binary(input_path, output_path, seed, min_price=1, max_price=9999, dry_run=False):
+    """Randomize prices in ShopItem.uexp using intelligent binary scanning
+
+    With dry_run=True the scan and randomization still run (so the counts
+    are reported) but nothing is written to output_path.
+    """
     
     print(f"=== ShopItem Binary Price Randomizer (Intelligent) ===")
     print(f"Input: {Path(input_path).name}")
     print(f"Seed: {seed}")
     print(f"Price range: {min_price}-{max_price}\n")
     
-    # Read the file
+    # Map the file read-only instead of reading it into memory
+    # (mmap cannot map an empty file)
     with open(input_path, 'rb') as f:
-        data = bytearray(f.read())
+        file_size = os.fstat(f.fileno()).st_size
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if file_size else b''
     
-    print(f"File size: {len(data)} bytes")
+    print(f"File size: {file_size} bytes")
     
-    # Find price arrays
-    arrays = find_price_arrays(data, min_price, max_price)
+    # Find price arrays (the map is closed even if the scan fails)
+    try:
+        arrays = find_price_arrays(data, min_price, max_price)
+    finally:
+        if file_size:
+            data.close()
     print(f"Found {len(arrays)} potential price arrays\n")
     
     if len(arrays) == 0:
         print("ERROR: No price arrays found")
         return False
     
-    # Show first few arrays
-    print("First 5 arrays found:")
+    # Show first few arrays (built up and written once; per-line console writes are slow on Windows)
+    lines = ["First 5 arrays found:"]
     for idx, (offset, count, prices) in enumerate(arrays[:5]):
-        non_zero = len([p for p in prices if p > 0])
-        print(f"  {idx+1}. Offset 0x{offset:08X}: {count} items ({non_zero} prices)")
+        non_zero = count - prices.count(0)
+        lines.append(f"  {idx+1}. Offset 0x{offset:08X}: {count} items ({non_zero} prices)")
     
     if len(arrays) > 5:
-        print(f"  ... and {len(arrays) - 5} more")
+        lines.append(f"  ... and {len(arrays) - 5} more")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Randomize
     print(f"\nRandomizing prices...")
     rng = random.Random(seed)
+    getrandbits = rng.getrandbits
     total_modified = 0
+    patches = []  # (array offset, full new price list)
+    
+    # Rejection sampling on getrandbits is what randint() does internally, so
+    # a given seed still produces the same prices without the per-call overhead
+    span = max_price - min_price + 1
+    bits = span.bit_length()
     
     for offset, count, prices in arrays:
-        for j in range(count):
-            price_offset = offset + 4 + j * 4
-            old_price = struct.unpack('<I', data[price_offset:price_offset+4])[0]
-            
+        # prices already holds the values read during the scan; no need to re-read them
+        new_prices = list(prices)
+        for j, old_price in enumerate(prices):
             # Only randomize non-zero prices (zero means not yet available)
             if old_price > 0:
-                new_price = rng.randint(min_price, max_price)
-                data[price_offset:price_offset+4] = struct.pack('<I', new_price)
+                r = getrandbits(bits)
+                while r >= span:
+                    r = getrandbits(bits)
+                new_prices[j] = min_price + r
                 total_modified += 1
+        patches.append((offset, new_prices))
+    
+    if dry_run:
+        print(f"Would modify {total_modified} price values")
+        print("\n(dry run - no output written)")
+        return True
     
     print(f"Modified {total_modified} price values")
     
-    # Write output
-    with open(output_path, 'wb') as f:
-        f.write(data)
+    # Write output: copy the input, then patch only the price arrays in place
+    # through a writable map instead of rewriting the whole file. Each array is
+    # contiguous, so it is written back with a single pack_into
+    try:
+        shutil.copyfile(input_path, output_path)
+    except shutil.SameFileError:
+        pass  # Randomizing in place
+    
+    with open(output_path, 'r+b') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_WRITE) as out:
+            for offset, new_prices in patches:
+                PRICE_ARRAY_STRUCTS[len(new_prices)].pack_into(out, offset + 4, *new_prices)
+            out.flush()
     
     print(f"\n✓ Saved to: {Path(output_path).name}")
     return True
@@ -229,6 +270,7 @@ ARGUMENTS:
 
 FLAGS:
   --auto-deploy  Enable automatic repacking and deployment
+  --dry-run      Only report how many arrays/prices would change (no files written)
   --help, -h     Show this help message
 
 EXAMPLES:
@@ -276,40 +318,63 @@ SEE ALSO:
     print(help_text)
 
 
-def main():
-    # Handle help flags first
-    if len(sys.argv) < 2 or sys.argv[1] in ['--help', '-h', 'help', '/?']:
-        print_help()
-        sys.exit(0)
+def parse_cli_args(argv):
+    """Parse the command line (without the program name).
     
-    input_path = sys.argv[1]
+    Returns (input_path, output_path, seed, min_price, max_price, dry_run, auto_deploy),
+    or None when help was requested or no input file was given.
+    """
+    # Strip --dry-run before reading any positional, so it may appear anywhere
+    dry_run = '--dry-run' in argv
+    args = [arg for arg in argv if arg != '--dry-run']
+    
+    if not args or args[0] in ['--help', '-h', 'help', '/?']:
+        return None
+    
+    input_path = args[0]
     
     # Check for --auto-deploy flag
-    auto_deploy = '--auto-deploy' in sys.argv
+    auto_deploy = '--auto-deploy' in args
     
     if auto_deploy:
         # Auto mode: randomize in place and deploy
         output_path = input_path + ".tmp"
-        argv_offset = sys.argv.index('--auto-deploy')
-        seed = int(sys.argv[argv_offset + 1]) if len(sys.argv) > argv_offset + 1 else 12345
-        min_price = int(sys.argv[argv_offset + 2]) if len(sys.argv) > argv_offset + 2 else 1
-        max_price = int(sys.argv[argv_offset + 3]) if len(sys.argv) > argv_offset + 3 else 9999
+        argv_offset = args.index('--auto-deploy')
+        seed = int(args[argv_offset + 1]) if len(args) > argv_offset + 1 else 12345
+        min_price = int(args[argv_offset + 2]) if len(args) > argv_offset + 2 else 1
+        max_price = int(args[argv_offset + 3]) if len(args) > argv_offset + 3 else 9999
     else:
         # Manual mode: specify output path
-        output_path = sys.argv[2] if len(sys.argv) > 2 else Path(input_path).stem + "_randomized.uexp"
-        seed = int(sys.argv[3]) if len(sys.argv) > 3 else 12345
-        min_price = int(sys.argv[4]) if len(sys.argv) > 4 else 1
-        max_price = int(sys.argv[5]) if len(sys.argv) > 5 else 9999
+        output_path = args[1] if len(args) > 1 else Path(input_path).stem + "_randomized.uexp"
+        seed = int(args[2]) if len(args) > 2 else 12345
+        min_price = int(args[3]) if len(args) > 3 else 1
+        max_price = int(args[4]) if len(args) > 4 else 9999
+    
+    return input_path, output_path, seed, min_price, max_price, dry_run, auto_deploy
+
+
+def main():
+    parsed = parse_cli_args(sys.argv[1:])
+    
+    # Handle help flags first
+    if parsed is None:
+        print_help()
+        sys.exit(0)
+    
+    input_path, output_path, seed, min_price, max_price, dry_run, auto_deploy = parsed
     
     if not Path(input_path).exists():
         print(f"ERROR: {input_path} not found")
         sys.exit(1)
     
-    success = randomize_prices_binary(input_path, output_path, seed, min_price, max_price)
+    success = randomize_prices_binary(input_path, output_path, seed, min_price, max_price, dry_run)
     
     if not success:
         sys.exit(1)
     
+    if dry_run:
+        sys.exit(0)
+    
     if auto_deploy:
         print("\n" + "="*60)
         print("AUTOMATED DEPLOYMENT STARTING")
@@ -340,7 +405,8 @@ def main():
             shutil.copy2(dest_file, dest_file + ".bak")
             print(f"      ✓ Backed up original to .bak")
         
-        shutil.copy2(output_path, dest_file)
+        # Plain copyfile: the platform fast-copy path without copying metadata
+        shutil.copyfile(output_path, dest_file)
         print(f"      ✓ Replaced")
         
         # Step 2: Repack with retoc
@@ -359,10 +425,11 @@ def main():
             pak_output
         ]
         
-        result = subprocess.run(retoc_cmd, capture_output=True, text=True)
+        # Keep retoc's output as bytes; it is only decoded if we need to show it
+        result = subprocess.run(retoc_cmd, capture_output=True)
         if result.returncode != 0:
             print(f"      ✗ ERROR: retoc failed")
-            print(f"      {result.stderr}")
+            print(f"      {result.stderr.decode('utf-8', errors='replace')}")
             sys.exit(1)
         
         print(f"      ✓ Repacked successfully")
@@ -382,29 +449,45 @@ def main():
             (pak_output, pak_basename + '.utoc')  # No extension = .utoc data
         ]
         
-        for src, dst_name in files_to_copy:
-            dst = game_mods_dir / dst_name
+        # One listing of retoc's output dir instead of exists() + getsize() per file
+        with os.scandir(os.path.dirname(pak_output) or '.') as it:
+            pak_entries = {entry.name: entry for entry in it}
+        
+        # The three copies are independent, so overlap them (helps on HDDs and
+        # cloud-synced mods folders); results are still reported in order
+        with ThreadPoolExecutor(max_workers=len(files_to_copy)) as executor:
+            copies = []
+            for src, dst_name in files_to_copy:
+                entry = pak_entries.get(os.path.basename(src))
+                future = None
+                if entry is not None:
+                    future = executor.submit(shutil.copyfile, src, game_mods_dir / dst_name)
+                copies.append((src, dst_name, entry, future))
             
-            if os.path.exists(src):
-                shutil.copy2(src, dst)
-                file_size = os.path.getsize(dst)
-                print(f"      ✓ {dst_name} ({file_size:,} bytes)")
-            else:
-                print(f"      ✗ WARNING: {os.path.basename(src)} not found at {src}")
+            for src, dst_name, entry, future in copies:
+                if future is not None:
+                    future.result()
+                    print(f"      ✓ {dst_name} ({entry.stat().st_size:,} bytes)")
+                else:
+                    print(f"      ✗ WARNING: {os.path.basename(src)} not found at {src}")
         
         # Step 4: Cleanup
         print(f"\n[4/4] Cleaning up temporary files...")
-        if os.path.exists(output_path):
+        try:
             os.remove(output_path)
             print(f"      ✓ Removed {output_path}")
+        except FileNotFoundError:
+            pass
         
-        print("\n" + "="*60)
-        print("✅ DEPLOYMENT COMPLETE!")
-        print("="*60)
-        print(f"\nMod deployed to: {game_mods_dir}")
-        print(f"Seed: {seed}")
-        print(f"Price range: {min_price}-{max_price} gil")
-        print("\n🎮 Ready to test in-game!")
+        sys.stdout.write("\n".join([
+            "\n" + "="*60,
+            "✅ DEPLOYMENT COMPLETE!",
+            "="*60,
+            f"\nMod deployed to: {game_mods_dir}",
+            f"Seed: {seed}",
+            f"Price range: {min_price}-{max_price} gil",
+            "\n🎮 Ready to test in-game!",
+        ]) + "\n")
     
     sys.exit(0)
 
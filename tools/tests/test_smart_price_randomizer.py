@@ -0,0 +1,68 @@
+"""Tests for smart_price_randomizer command-line parsing and dry-run mode."""
+
+import contextlib
+import io
+import struct
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from smart_price_randomizer import parse_cli_args, randomize_prices_binary
+
+
+class TestParseCliArgs(unittest.TestCase):
+    def test_dry_run_first(self):
+        self.assertEqual(
+            parse_cli_args(['--dry-run', 'ShopItem.uexp', 'out.uexp', '42', '10', '500']),
+            ('ShopItem.uexp', 'out.uexp', 42, 10, 500, True, False))
+
+    def test_dry_run_last(self):
+        self.assertEqual(
+            parse_cli_args(['ShopItem.uexp', 'out.uexp', '42', '10', '500', '--dry-run']),
+            ('ShopItem.uexp', 'out.uexp', 42, 10, 500, True, False))
+
+    def test_dry_run_first_with_defaults(self):
+        self.assertEqual(
+            parse_cli_args(['--dry-run', 'ShopItem.uexp']),
+            ('ShopItem.uexp', 'ShopItem_randomized.uexp', 12345, 1, 9999, True, False))
+
+    def test_no_dry_run(self):
+        self.assertEqual(
+            parse_cli_args(['ShopItem.uexp', 'out.uexp', '42']),
+            ('ShopItem.uexp', 'out.uexp', 42, 1, 9999, False, False))
+
+    def test_dry_run_with_auto_deploy(self):
+        for argv in (['--dry-run', 'ShopItem.uexp', '--auto-deploy', '7', '5', '50'],
+                     ['ShopItem.uexp', '--auto-deploy', '7', '5', '50', '--dry-run']):
+            self.assertEqual(
+                parse_cli_args(argv),
+                ('ShopItem.uexp', 'ShopItem.uexp.tmp', 7, 5, 50, True, True))
+
+    def test_help_or_missing_input(self):
+        for argv in ([], ['--dry-run'], ['--help'], ['--dry-run', '-h']):
+            self.assertIsNone(parse_cli_args(argv))
+
+
+class TestDryRun(unittest.TestCase):
+    def test_dry_run_writes_nothing(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = Path(tmp) / 'ShopItem.uexp'
+            output_path = Path(tmp) / 'ShopItem_randomized.uexp'
+            # Padding, then one 3-entry price array: [count][prices...]
+            original = b'\xff' * 8 + struct.pack('<4I', 3, 100, 250, 0) + b'\xff' * 8
+            input_path.write_bytes(original)
+            
+            with contextlib.redirect_stdout(io.StringIO()) as out:
+                success = randomize_prices_binary(str(input_path), str(output_path), 42, dry_run=True)
+            
+            self.assertTrue(success)
+            self.assertIn('Would modify 2 price values', out.getvalue())
+            self.assertFalse(output_path.exists())
+            self.assertEqual(input_path.read_bytes(), original)
+
+
+if __name__ == '__main__':
+    unittest.main()
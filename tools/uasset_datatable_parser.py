@@ -8,11 +8,41 @@ Usage: python uasset_datatable_parser.py <uasset_path> [output.json]
 
 import sys
 import json
+import mmap
+import multiprocessing
+import re
 import struct
 import os
 from pathlib import Path
 from typing import List, Dict, Any, Tuple, Optional, BinaryIO
 
+try:
+    import orjson  # Optional: much faster JSON output for large tables
+except ImportError:
+    orjson = None
+
+# Precompiled little-endian codecs; unpack_from reads in place without slicing
+INT32 = struct.Struct('<i')
+UINT32 = struct.Struct('<I')
+INT64 = struct.Struct('<q')
+UINT64 = struct.Struct('<Q')
+FLOAT = struct.Struct('<f')
+DOUBLE = struct.Struct('<d')
+FNAME = struct.Struct('<ii')  # name table index + number
+
+# struct codes for ArrayProperty inner types stored as flat 4-byte values
+PRIMITIVE_ARRAY_CODES = {"IntProperty": "i", "FloatProperty": "f"}
+
+# A length-prefixed string length of 4-199 stored as a little-endian int32: low byte
+# 0x04-0xC7, then three zero bytes. Two matches can never overlap.
+STRING_LENGTH_PATTERN = re.compile(rb'[\x04-\xc7]\x00\x00\x00')
+
+# ASCII control characters (0x00-0x1F, 0x7F), for bytes.translate(None, ...)
+CONTROL_BYTES = bytes(range(0x20)) + b'\x7f'
+
+# A run of zero uint32 words (padding)
+ZERO_WORDS_PATTERN = re.compile(rb'(?:\x00\x00\x00\x00)*')
+
 class UE4DataTableParser:
     """Parser for UE4 DataTable .uasset files."""
     
@@ -23,7 +53,8 @@ class UE4DataTableParser:
         self.uexp_path = uasset_path.replace('.uasset', '.uexp')
         self.data = b''
         self.uexp_data = b''
-        self.names: List[str] = []
+        self.names: Tuple[str, ...] = ()
+        self._fname_cache: Dict[Tuple[int, int], str] = {}
         self.imports: List[Dict] = []
         self.exports: List[Dict] = []
         self.name_offset = 0
@@ -32,15 +63,32 @@ class UE4DataTableParser:
         self.total_header_size = 0
         self.bulk_data_start = 0
         
+    @staticmethod
+    def _map_file(path: str):
+        """Map a file read-only so only the pages the parser touches are read."""
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b''  # mmap cannot map an empty file
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
     def read_file(self) -> Dict[str, Any]:
         """Read and parse the uasset file."""
-        with open(self.uasset_path, 'rb') as f:
-            self.data = f.read()
+        self.data = self._map_file(self.uasset_path)
         
         if os.path.exists(self.uexp_path):
-            with open(self.uexp_path, 'rb') as f:
-                self.uexp_data = f.read()
+            self.uexp_data = self._map_file(self.uexp_path)
         
+        try:
+            return self._parse()
+        finally:
+            for buf in (self.data, self.uexp_data):
+                if isinstance(buf, mmap.mmap):
+                    buf.close()
+            self.data = b''
+            self.uexp_data = b''
+    
+    def _parse(self) -> Dict[str, Any]:
+        """Parse the mapped uasset/uexp data."""
         result = {
             "file": self.uasset_path,
             "names": [],
@@ -54,7 +102,9 @@ class UE4DataTableParser:
             result["header"] = header_info
             
             # Parse name table
-            self.names = self._parse_name_table()
+            # Tuple: the name table is fixed once parsed and indexed constantly
+            self.names = tuple(self._parse_name_table())
+            self._fname_cache = {}
             result["names"] = self.names
             
             # Parse imports
@@ -81,28 +131,22 @@ class UE4DataTableParser:
         return data[pos], pos + 1
     
     def _read_int32(self, data: bytes, pos: int) -> Tuple[int, int]:
-        val = struct.unpack('<i', data[pos:pos+4])[0]
-        return val, pos + 4
+        return INT32.unpack_from(data, pos)[0], pos + 4
     
     def _read_uint32(self, data: bytes, pos: int) -> Tuple[int, int]:
-        val = struct.unpack('<I', data[pos:pos+4])[0]
-        return val, pos + 4
+        return UINT32.unpack_from(data, pos)[0], pos + 4
     
     def _read_int64(self, data: bytes, pos: int) -> Tuple[int, int]:
-        val = struct.unpack('<q', data[pos:pos+8])[0]
-        return val, pos + 8
+        return INT64.unpack_from(data, pos)[0], pos + 8
     
     def _read_uint64(self, data: bytes, pos: int) -> Tuple[int, int]:
-        val = struct.unpack('<Q', data[pos:pos+8])[0]
-        return val, pos + 8
+        return UINT64.unpack_from(data, pos)[0], pos + 8
     
     def _read_float(self, data: bytes, pos: int) -> Tuple[float, int]:
-        val = struct.unpack('<f', data[pos:pos+4])[0]
-        return val, pos + 4
+        return FLOAT.unpack_from(data, pos)[0], pos + 4
     
     def _read_double(self, data: bytes, pos: int) -> Tuple[float, int]:
-        val = struct.unpack('<d', data[pos:pos+8])[0]
-        return val, pos + 8
+        return DOUBLE.unpack_from(data, pos)[0], pos + 8
     
     def _read_guid(self, data: bytes, pos: int) -> Tuple[str, int]:
         guid_bytes = data[pos:pos+16]
@@ -141,13 +185,21 @@ class UE4DataTableParser:
         if pos + 8 > len(data):
             return "<invalid>", pos
         
-        name_idx, pos = self._read_int32(data, pos)
-        name_num, pos = self._read_int32(data, pos)
+        name_idx, name_num = FNAME.unpack_from(data, pos)
+        pos += 8
+        
+        # Resolved names are cached per (index, number); DataTables reuse a
+        # small set of FNames thousands of times
+        key = (name_idx, name_num)
+        name = self._fname_cache.get(key)
+        if name is not None:
+            return name, pos
         
         if 0 <= name_idx < len(self.names):
             name = self.names[name_idx]
             if name_num > 0:
                 name = f"{name}_{name_num-1}"
+            self._fname_cache[key] = name
             return name, pos
         return f"<name_{name_idx}>", pos
     
@@ -225,19 +277,43 @@ class UE4DataTableParser:
         names = []
         pos = self.name_offset
         data = self.data
-        
-        # Read names until we hit export offset or run out
-        while pos < self.import_offset and pos < len(data) - 4:
-            try:
-                name, pos = self._read_fstring(data, pos)
-                if not name:
+        data_len = len(data)
+        read_length = INT32.unpack_from
+        
+        # Read names until we hit export offset or run out. This is _read_fstring
+        # inlined into one loop, since name tables can hold tens of thousands of
+        # entries; an empty or unreadable name ends the table
+        while pos < self.import_offset and pos < data_len - 4:
+            length = read_length(data, pos)[0]
+            pos += 4
+            
+            if length > 0:  # ASCII/UTF-8
+                if pos + length > data_len:
                     break
-                # Skip hash (UE4 stores case-insensitive hash after name)
-                if pos + 4 <= len(data):
-                    pos += 4
-                names.append(name)
-            except:
+                raw = data[pos:pos+length-1]
+                try:
+                    name = raw.decode('ascii')  # Names are almost always plain ASCII
+                except UnicodeDecodeError:
+                    name = raw.decode('utf-8', errors='replace')
+                pos += length
+            elif length < 0:  # UTF-16
+                byte_length = -length * 2
+                if pos + byte_length > data_len:
+                    break
+                try:
+                    name = data[pos:pos+byte_length-2].decode('utf-16-le')
+                except UnicodeDecodeError:
+                    break
+                pos += byte_length
+            else:
+                break
+            
+            if not name:
                 break
+            # Skip hash (UE4 stores case-insensitive hash after name)
+            if pos + 4 <= data_len:
+                pos += 4
+            names.append(name)
         
         return names
     
@@ -342,9 +418,9 @@ class UE4DataTableParser:
         
         # First, try to read as standard property list
         try:
-            # Skip any leading zeros or padding
-            while pos < len(data) - 4 and data[pos:pos+4] == b'\x00\x00\x00\x00':
-                pos += 4
+            # Skip any leading zeros or padding (whole zero words, found in one C-level
+            # match), stopping at the last word as the old per-word loop did
+            pos = min(ZERO_WORDS_PATTERN.match(data).end(), (len(data) - 1) // 4 * 4)
             
             # Try reading row count
             row_count, pos = self._read_int32(data, pos)
@@ -451,6 +527,16 @@ class UE4DataTableParser:
                 inner_type, pos = self._read_fname(data, pos)
                 pos += 1  # Skip null byte
                 count, pos = self._read_int32(data, pos)
+                
+                # Int/float/bool arrays are flat packed values: decode them in one call
+                # when they fit in the buffer
+                n = max(0, min(count, 100))
+                code = PRIMITIVE_ARRAY_CODES.get(inner_type)
+                if code is not None and pos + n * 4 <= len(data):
+                    return list(struct.unpack_from(f'<{n}{code}', data, pos)), pos + n * 4
+                if inner_type == "BoolProperty" and pos + n <= len(data):
+                    return [b != 0 for b in data[pos:pos+n]], pos + n
+                
                 arr = []
                 for _ in range(min(count, 100)):
                     elem, pos = self._read_property_value(data, pos, inner_type, 0)
@@ -471,10 +557,11 @@ class UE4DataTableParser:
             else:
                 # Unknown type - skip by size
                 if size > 0:
-                    raw = data[pos:pos+size]
+                    # Only the first 32 bytes are shown; don't copy the whole value
+                    raw = data[pos:pos+min(size, 32)]
                     pos += size
                     # Try to extract any strings
-                    return f"<{prop_type}:{raw[:32].hex()}>", pos
+                    return f"<{prop_type}:{raw.hex()}>", pos
                 return f"<{prop_type}>", pos
                 
         except Exception as e:
@@ -487,35 +574,91 @@ class UE4DataTableParser:
         # Look for FName patterns (name_index, name_number both int32)
         # followed by property data
         
-        pos = 0
-        row_id = 0
+        names = self.names
+        # Check if each name looks like a row name (not "None", not empty)
+        is_row_name = [bool(name) and name != "None" and not name.startswith("/") for name in names]
+        
+        # Look for a valid name index at every offset before len(data) - 16. Decode
+        # each of the four alignments with iter_unpack and keep only the offsets
+        # naming a row, then visit those in file order
+        candidates = []
+        end = len(data) - 16
+        # Release the view before returning so an mmap'd buffer can still be closed
+        with memoryview(data) as view:
+            for align in range(4):
+                count = max(0, (end - align + 3) // 4)
+                with view[align:align + count * 4] as words:
+                    for k, (name_idx,) in enumerate(UINT32.iter_unpack(words)):
+                        if name_idx < len(names) and is_row_name[name_idx]:
+                            candidates.append((align + k * 4, name_idx))
+        candidates.sort()
         
-        while pos < len(data) - 16:
-            # Look for a valid name index
-            name_idx = struct.unpack('<I', data[pos:pos+4])[0]
-            
-            if name_idx < len(self.names):
-                row_name = self.names[name_idx]
-                
-                # Check if this looks like a row name (not "None", not empty)
-                if row_name and row_name != "None" and not row_name.startswith("/"):
-                    # Try to read properties starting after the FName
-                    try:
-                        props, _ = self._read_properties(data, pos + 8)
-                        if props:
-                            rows.append({
-                                "_index": row_id,
-                                "_row_name": row_name,
-                                **props
-                            })
-                            row_id += 1
-                    except:
-                        pass
-            
-            pos += 1
+        row_id = 0
+        for pos, name_idx in candidates:
+            # Try to read properties starting after the FName
+            try:
+                props, _ = self._read_properties(data, pos + 8)
+                if props:
+                    rows.append({
+                        "_index": row_id,
+                        "_row_name": names[name_idx],
+                        **props
+                    })
+                    row_id += 1
+            except:
+                pass
         
         return rows
     
+    def _scan_buffer(self, data: bytes, strings: set, ints: set, floats: set) -> None:
+        """Collect length-prefixed strings and aligned int/float values from one buffer."""
+        # The scans below walk the data front to back
+        if isinstance(data, mmap.mmap) and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            data.madvise(mmap.MADV_SEQUENTIAL)
+        
+        # Look for length-prefixed strings. Only offsets holding a length of 4-199
+        # can start one, so let the regex engine find those instead of unpacking
+        # an int32 at every byte offset
+        scan_end = len(data) - 8
+        for match in STRING_LENGTH_PATTERN.finditer(data):
+            pos = match.start()
+            if pos >= scan_end:
+                break
+            length = data[pos]  # Little-endian: the low byte is the length
+            raw = data[pos+4:pos+4+length-1]
+            # ASCII control bytes always decode to non-printable characters, so most
+            # random candidates can be rejected without a decode attempt
+            if len(raw.translate(None, CONTROL_BYTES)) != len(raw):
+                continue
+            if raw.isascii():
+                # Control-free ASCII is printable as-is
+                if len(raw) >= 3:
+                    strings.add(raw.decode('ascii'))
+                continue
+            try:
+                s = raw.decode('utf-8', errors='strict')
+                if s.isprintable() and len(s) >= 3:
+                    strings.add(s)
+            except:
+                pass
+        
+        # The integer/float scans look at every aligned word before the last 4 bytes;
+        # iter_unpack decodes them lazily in C instead of one slice + unpack each
+        # (the views are released on exit so an mmap'd buffer can still be closed)
+        with memoryview(data) as view, view[:max(0, (len(data) - 1) // 4) * 4] as words:
+            # Find integer patterns (look for reasonable values)
+            for (val,) in INT32.iter_unpack(words):
+                if 0 < val < 100000:
+                    ints.add(val)
+            
+            # Find float patterns
+            # NaN fails every comparison, so the range check alone also rejects NaN and inf.
+            # A plain loop (not a generator) so an exception cannot leave the iterator
+            # holding the view alive while it is released
+            for (val,) in FLOAT.iter_unpack(words):
+                if 0.001 < abs(val) < 10000:
+                    floats.add(round(val, 3))
+    
     def _enhanced_extraction(self) -> Dict[str, Any]:
         """Enhanced extraction that finds patterns in the data."""
         result = {
@@ -526,8 +669,6 @@ class UE4DataTableParser:
             "name_references": []
         }
         
-        all_data = self.data + self.uexp_data
-        
         # Find all strings (both ASCII and in name table references)
         strings = set()
         
@@ -536,43 +677,17 @@ class UE4DataTableParser:
             if name and not name.startswith("/Script") and len(name) > 2:
                 strings.add(name)
         
-        # Look for length-prefixed strings
-        pos = 0
-        while pos < len(all_data) - 8:
-            length = struct.unpack('<i', all_data[pos:pos+4])[0]
-            if 3 < length < 200:
-                try:
-                    s = all_data[pos+4:pos+4+length-1].decode('utf-8', errors='strict')
-                    if s.isprintable() and len(s) >= 3:
-                        strings.add(s)
-                except:
-                    pass
-            pos += 1
+        # Scan the .uasset and .uexp separately rather than a concatenated copy of
+        # both: nothing we look for straddles the file boundary, and each file keeps
+        # its own word alignment
+        ints = set()
+        floats = set()
+        for buf in (self.data, self.uexp_data):
+            self._scan_buffer(buf, strings, ints, floats)
         
         result["strings"] = sorted(list(strings))
-        
-        # Find integer patterns (look for reasonable values)
-        pos = 0
-        ints = []
-        while pos < len(all_data) - 4:
-            val = struct.unpack('<i', all_data[pos:pos+4])[0]
-            if 0 < val < 100000 and val not in ints:
-                ints.append(val)
-            pos += 4
-        result["integers"] = sorted(set(ints))[:100]
-        
-        # Find float patterns
-        pos = 0
-        floats = []
-        while pos < len(all_data) - 4:
-            try:
-                val = struct.unpack('<f', all_data[pos:pos+4])[0]
-                if 0.001 < abs(val) < 10000 and val == val:  # Not NaN
-                    floats.append(round(val, 3))
-            except:
-                pass
-            pos += 4
-        result["floats"] = sorted(set(floats))[:100]
+        result["integers"] = sorted(ints)[:100]
+        result["floats"] = sorted(floats)[:100]
         
         return result
 
@@ -587,33 +702,54 @@ def export_to_json(uasset_path: str, output_path: str = None) -> str:
     if output_path is None:
         output_path = str(Path(uasset_path).with_suffix('.json'))
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, default=str)
+    if orjson is not None:
+        # Single C-level serialization pass
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2, default=str))
+    else:
+        # json.dump already streams chunks from iterencode to the file
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, default=str, ensure_ascii=False)
     
     row_count = len(result.get("rows", []))
     print(f"  Exported to: {output_path} ({row_count} rows)")
     return output_path
 
 
+def _export_one(job: Tuple[Path, Path]) -> Dict[str, str]:
+    """Export one file for batch_export (runs in a worker process)."""
+    uasset_file, output_folder = job
+    try:
+        output_file = output_folder / (uasset_file.stem + ".json")
+        export_to_json(str(uasset_file), str(output_file))
+        return {"file": str(uasset_file), "status": "success"}
+    except Exception as e:
+        print(f"  ERROR: {e}")
+        return {"file": str(uasset_file), "status": "error", "error": str(e)}
+
+
 def batch_export(folder_path: str):
     """Export all .uasset files in a folder."""
     folder = Path(folder_path)
-    uasset_files = list(folder.glob('*.uasset'))
+    # One directory listing; scandir entries know their type without a stat per file
+    # (normcase keeps glob's case-insensitive match on Windows)
+    with os.scandir(folder) as entries:
+        uasset_files = [Path(entry.path) for entry in entries
+                        if os.path.normcase(entry.name).endswith('.uasset') and entry.is_file()]
     
     print(f"Found {len(uasset_files)} .uasset files")
     
     output_folder = folder / "parsed_json"
     output_folder.mkdir(exist_ok=True)
     
+    # Each file parses independently, so spread them across processes;
+    # map() keeps the results in file order
+    jobs = [(uasset_file, output_folder) for uasset_file in uasset_files]
     results = []
-    for uasset_file in uasset_files:
-        try:
-            output_file = output_folder / (uasset_file.stem + ".json")
-            export_to_json(str(uasset_file), str(output_file))
-            results.append({"file": str(uasset_file), "status": "success"})
-        except Exception as e:
-            print(f"  ERROR: {e}")
-            results.append({"file": str(uasset_file), "status": "error", "error": str(e)})
+    if jobs:
+        processes = min(os.cpu_count() or 1, len(jobs))
+        with multiprocessing.Pool(processes=processes) as pool:
+            results = pool.map(_export_one, jobs, chunksize=4)
     
     summary_path = output_folder / "_parse_summary.json"
     with open(summary_path, 'w') as f:
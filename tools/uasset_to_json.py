@@ -8,11 +8,42 @@ Usage: python uasset_to_json.py <path_to_uasset> [output.json]
 
 import sys
 import json
+import mmap
+import multiprocessing
+import re
 import struct
 import os
 from pathlib import Path
 from typing import List, Dict, Any, Tuple, Optional
 
+try:
+    import orjson  # Optional: much faster JSON output for large assets
+except ImportError:
+    orjson = None
+
+# Precompiled little-endian codecs; unpack_from reads in place without slicing
+UINT32 = struct.Struct('<I')
+INT32 = struct.Struct('<i')
+
+# Fixed-size table records, each decoded in a single call
+# Import: class package, class name (FName), outer index, object name (FName)
+IMPORT_RECORD = struct.Struct('<qqiq')
+# Export: class/super index, template/outer index, object name, object flags,
+# serial size/offset, forced export, not for client/server, package GUID
+# (skipped), package flags, not always loaded for editor game, is asset
+EXPORT_RECORD = struct.Struct('<qqiiqIqqiii16xIii')
+
+# Runs of 4+ printable ASCII bytes (the minimum extracted string length)
+PRINTABLE_RUN_PATTERN = re.compile(rb'[\x20-\x7e]{4,}')
+
+# A length-prefixed string length of 2-255 stored as a little-endian int32: low byte
+# 0x02-0xFF, then three zero bytes. Two matches can never overlap.
+STRING_LENGTH_PATTERN = re.compile(rb'[\x02-\xff]\x00\x00\x00')
+
+# ASCII bytes whose character passes isprintable() or isspace(); deleting these
+# with bytes.translate leaves only the bytes that need a closer look
+PRINTABLE_ASCII_BYTES = bytes(range(0x09, 0x0e)) + bytes(range(0x1c, 0x7f))
+
 class UAssetReader:
     """Basic UE4 .uasset file reader."""
     
@@ -29,16 +60,33 @@ class UAssetReader:
         self.imports: List[Dict] = []
         self.exports: List[Dict] = []
         
+    @staticmethod
+    def _map_file(path: str):
+        """Map a file read-only so only the pages the parser touches are read."""
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b''  # mmap cannot map an empty file
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
     def read(self) -> Dict[str, Any]:
         """Read and parse the uasset file."""
-        with open(self.uasset_path, 'rb') as f:
-            self.data = f.read()
+        self.data = self._map_file(self.uasset_path)
         
         # Read .uexp if exists (contains bulk data)
         if os.path.exists(self.uexp_path):
-            with open(self.uexp_path, 'rb') as f:
-                self.uexp_data = f.read()
+            self.uexp_data = self._map_file(self.uexp_path)
         
+        try:
+            return self._parse()
+        finally:
+            for buf in (self.data, self.uexp_data):
+                if isinstance(buf, mmap.mmap):
+                    buf.close()
+            self.data = b''
+            self.uexp_data = b''
+    
+    def _parse(self) -> Dict[str, Any]:
+        """Parse the mapped uasset/uexp data."""
         self.pos = 0
         
         # Parse header
@@ -66,25 +114,15 @@ class UAssetReader:
         }
     
     def _read_uint32(self) -> int:
-        val = struct.unpack('<I', self.data[self.pos:self.pos+4])[0]
+        val = UINT32.unpack_from(self.data, self.pos)[0]
         self.pos += 4
         return val
     
     def _read_int32(self) -> int:
-        val = struct.unpack('<i', self.data[self.pos:self.pos+4])[0]
+        val = INT32.unpack_from(self.data, self.pos)[0]
         self.pos += 4
         return val
     
-    def _read_uint64(self) -> int:
-        val = struct.unpack('<Q', self.data[self.pos:self.pos+8])[0]
-        self.pos += 8
-        return val
-    
-    def _read_int64(self) -> int:
-        val = struct.unpack('<q', self.data[self.pos:self.pos+8])[0]
-        self.pos += 8
-        return val
-    
     def _read_guid(self) -> str:
         data = self.data[self.pos:self.pos+16]
         self.pos += 16
@@ -187,24 +225,48 @@ class UAssetReader:
     
     def _read_names(self, header: Dict):
         """Read the name table."""
-        self.pos = header["name_offset"]
-        
-        for _ in range(header["name_count"]):
-            name = self._read_fstring()
-            # Skip hash
-            if self.pos + 4 <= len(self.data):
-                self._read_uint32()  # case insensitive hash
-            self.names.append(name)
+        # _read_fstring inlined into one loop over a memoryview: names decode
+        # straight from the buffer with str(view, encoding), with no slice copies
+        pos = header["name_offset"]
+        data_len = len(self.data)
+        read_length = INT32.unpack_from
+        
+        with memoryview(self.data) as view:
+            for _ in range(header["name_count"]):
+                length = read_length(view, pos)[0]
+                pos += 4
+                
+                if length > 0:
+                    try:
+                        name = str(view[pos:pos+length-1], 'utf-8')
+                    except UnicodeDecodeError:
+                        name = f"<binary:{view[pos:pos+length].hex()}>"
+                    pos += length
+                elif length < 0:  # Negative length means UTF-16
+                    length = -length * 2
+                    try:
+                        name = str(view[pos:pos+length-2], 'utf-16-le')
+                    except UnicodeDecodeError:
+                        name = f"<binary:{view[pos:pos+length].hex()}>"
+                    pos += length
+                else:
+                    name = ""
+                
+                # Skip hash
+                if pos + 4 <= data_len:
+                    pos += 4  # case insensitive hash
+                # Interned: import/export entries reference the same few names repeatedly
+                self.names.append(sys.intern(name))
+        
+        self.pos = pos
     
     def _read_imports(self, header: Dict):
         """Read the import table."""
         self.pos = header["import_offset"]
         
         for _ in range(header["import_count"]):
-            class_package = self._read_int64()
-            class_name = self._read_int64()
-            outer_index = self._read_int32()
-            object_name = self._read_int64()
+            class_package, class_name, outer_index, object_name = IMPORT_RECORD.unpack_from(self.data, self.pos)
+            self.pos += IMPORT_RECORD.size
             
             # Resolve names
             class_package_name = self._get_name(class_package) if class_package >= 0 else ""
@@ -223,25 +285,12 @@ class UAssetReader:
         self.pos = header["export_offset"]
         
         for _ in range(header["export_count"]):
-            class_index = self._read_int64()
-            super_index = self._read_int64()
-            template_index = self._read_int32()
-            outer_index = self._read_int32()
-            object_name = self._read_int64()
-            
-            save = self._read_uint32()  # ObjectFlags
-            serial_size = self._read_int64()
-            serial_offset = self._read_int64()
-            
-            forced_export = self._read_int32()
-            not_for_client = self._read_int32()
-            not_for_server = self._read_int32()
-            
-            package_guid = self._read_guid()
-            package_flags = self._read_uint32()
-            
-            not_always_loaded_for_editor_game = self._read_int32()
-            is_asset = self._read_int32()
+            (class_index, super_index, template_index, outer_index, object_name,
+             save, serial_size, serial_offset,
+             forced_export, not_for_client, not_for_server,
+             package_flags,
+             not_always_loaded_for_editor_game, is_asset) = EXPORT_RECORD.unpack_from(self.data, self.pos)
+            self.pos += EXPORT_RECORD.size
             
             # First export class to load (UE4.26+)
             self.pos += 4
@@ -315,41 +364,46 @@ class UAssetReader:
     
     def _extract_strings_from_bytes(self, data: bytes) -> List[str]:
         """Extract readable strings from binary data."""
-        strings = []
-        current = []
-        
-        for byte in data:
-            if 32 <= byte < 127:  # Printable ASCII
-                current.append(chr(byte))
-            else:
-                if len(current) >= 4:  # Minimum string length
-                    strings.append(''.join(current))
-                current = []
-        
-        if len(current) >= 4:
-            strings.append(''.join(current))
-        
-        # Also try to find length-prefixed strings
-        pos = 0
-        while pos < len(data) - 4:
-            length = struct.unpack('<i', data[pos:pos+4])[0]
-            if 1 < length < 256:  # Reasonable string length
-                try:
-                    if pos + 4 + length <= len(data):
-                        s = data[pos+4:pos+4+length-1].decode('utf-8', errors='ignore')
+        # Runs of printable ASCII, found by the regex engine in one pass.
+        # A dict dedupes in O(1) per string while keeping first-seen order
+        found = dict.fromkeys(run.decode('ascii') for run in PRINTABLE_RUN_PATTERN.findall(data))
+        
+        # Also try to find length-prefixed strings. Only offsets holding a
+        # reasonable length (2-255) can start one, so visit just those
+        data_len = len(data)
+        scan_end = data_len - 4
+        for match in STRING_LENGTH_PATTERN.finditer(data):
+            pos = match.start()
+            if pos >= scan_end:
+                break
+            length = data[pos]  # Little-endian: the low byte is the length
+            try:
+                if pos + 4 + length <= data_len:
+                    raw = data[pos+4:pos+4+length-1]
+                    rejected = raw.translate(None, PRINTABLE_ASCII_BYTES)
+                    if not rejected:
+                        # Plain printable ASCII: validated in one C call
+                        if len(raw) >= 3:
+                            found.setdefault(raw.decode('ascii'))
+                    elif not rejected.isascii():
+                        # Non-ASCII bytes present: fall back to a per-char check
+                        s = raw.decode('utf-8', errors='ignore')
                         if s and all(c.isprintable() or c.isspace() for c in s):
-                            if s not in strings and len(s) >= 3:
-                                strings.append(s)
-                except:
-                    pass
-            pos += 1
+                            if len(s) >= 3:
+                                found.setdefault(s)
+                    # Otherwise an ASCII control byte survives decoding and fails the check
+            except:
+                pass
         
-        return list(set(strings))
+        return list(found)
     
     def _extract_strings(self) -> List[str]:
         """Extract all readable strings from the file."""
-        all_data = self.data + self.uexp_data
-        return self._extract_strings_from_bytes(all_data)
+        # Scan each (possibly mmap'd) buffer in place rather than copying both into
+        # one; a string spanning the .uasset/.uexp boundary is not a real string
+        found = dict.fromkeys(self._extract_strings_from_bytes(self.data))
+        found.update(dict.fromkeys(self._extract_strings_from_bytes(self.uexp_data)))
+        return list(found)
 
 
 def export_to_json(uasset_path: str, output_path: str = None) -> str:
@@ -375,17 +429,10 @@ def export_to_json(uasset_path: str, output_path: str = None) -> str:
                 with open(uexp_path, 'rb') as f:
                     data += f.read()
             
-            # Extract strings
-            strings = []
-            current = []
-            for byte in data:
-                if 32 <= byte < 127:
-                    current.append(chr(byte))
-                else:
-                    if len(current) >= 4:
-                        strings.append(''.join(current))
-                    current = []
-            result["extracted_strings"] = list(set(strings))
+            # Extract strings (as before, a run still open at the end of the data is not kept)
+            strings = [match.group().decode('ascii') for match in PRINTABLE_RUN_PATTERN.finditer(data)
+                       if match.end() < len(data)]
+            result["extracted_strings"] = list(dict.fromkeys(strings))
         except Exception as e2:
             result["string_extraction_error"] = str(e2)
     
@@ -393,13 +440,30 @@ def export_to_json(uasset_path: str, output_path: str = None) -> str:
     if output_path is None:
         output_path = str(Path(uasset_path).with_suffix('.json'))
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, default=str)
+    if orjson is not None:
+        # Single C-level serialization pass
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2, default=str))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, default=str, ensure_ascii=False)
     
     print(f"  Exported to: {output_path}")
     return output_path
 
 
+def _export_one(job: Tuple[Path, Path]) -> Dict[str, str]:
+    """Export one file for batch_export (runs in a worker process)."""
+    uasset_file, output_folder = job
+    try:
+        output_file = output_folder / (uasset_file.stem + ".json")
+        export_to_json(str(uasset_file), str(output_file))
+        return {"file": str(uasset_file), "status": "success"}
+    except Exception as e:
+        print(f"  ERROR: {e}")
+        return {"file": str(uasset_file), "status": "error", "error": str(e)}
+
+
 def batch_export(folder_path: str):
     """Export all .uasset files in a folder."""
     folder = Path(folder_path)
@@ -410,15 +474,14 @@ def batch_export(folder_path: str):
     output_folder = folder / "exported_json"
     output_folder.mkdir(exist_ok=True)
     
+    # Each file converts independently, so spread them across processes;
+    # imap() yields in job order, so the summary keeps file order
+    jobs = [(uasset_file, output_folder) for uasset_file in uasset_files]
     results = []
-    for uasset_file in uasset_files:
-        try:
-            output_file = output_folder / (uasset_file.stem + ".json")
-            export_to_json(str(uasset_file), str(output_file))
-            results.append({"file": str(uasset_file), "status": "success"})
-        except Exception as e:
-            print(f"  ERROR: {e}")
-            results.append({"file": str(uasset_file), "status": "error", "error": str(e)})
+    if jobs:
+        processes = min(os.cpu_count() or 1, len(jobs))
+        with multiprocessing.Pool(processes=processes) as pool:
+            results = list(pool.imap(_export_one, jobs, chunksize=4))
     
     # Write summary
     summary_path = output_folder / "_export_summary.json"
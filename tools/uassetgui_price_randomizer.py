@@ -5,6 +5,7 @@ Properly handles FF7R property structures via JSON
 """
 
 import json
+import mmap
 import subprocess
 import random
 import sys
@@ -12,6 +13,11 @@ import os
 import shutil
 from pathlib import Path
 
+try:
+    import orjson  # Optional: much faster parse/serialize of the exported JSON
+except ImportError:
+    orjson = None
+
 # Get the directory where this script is located
 script_dir = Path(__file__).parent
 
@@ -20,12 +26,14 @@ def run_command(cmd, description=""):
     """Run a command and return success status"""
     print(f"[*] {description}")
     print(f"    Command: {' '.join(cmd)}")
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    sys.stdout.flush()
+    # stdout streams straight to the console; only stderr is kept for the error report
+    result = subprocess.run(cmd, stderr=subprocess.PIPE)
     
     if result.returncode != 0:
         print(f"    ✗ FAILED (exit code {result.returncode})")
         if result.stderr:
-            print(f"    stderr: {result.stderr}")
+            print(f"    stderr: {result.stderr.decode('utf-8', errors='replace')}")
         return False
     else:
         print(f"    ✓ Success")
@@ -62,10 +70,17 @@ def randomize_prices_in_json(json_path, seed, min_price=1, max_price=9999):
     """Randomize all OverridePrice_Array values in the JSON"""
     print(f"[*] Loading JSON: {json_path}")
     
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if orjson is not None:
+        # Parse straight from the page cache; no intermediate bytes copy of the file
+        with open(json_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                data = orjson.loads(view)
+    else:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
     
     random.seed(seed)
+    randint = random.randint  # bound once; called for every price below
     modification_count = 0
     
     # Navigate to exports
@@ -96,19 +111,23 @@ def randomize_prices_in_json(json_path, seed, min_price=1, max_price=9999):
                     original_count = len(prop['Value'])
                     
                     # Randomize each price in the array
-                    for i, price_entry in enumerate(prop['Value']):
+                    for price_entry in prop['Value']:
                         if isinstance(price_entry, dict) and 'Value' in price_entry:
-                            old_price = price_entry.get('Value', 0)
-                            new_price = random.randint(min_price, max_price)
-                            price_entry['Value'] = new_price
+                            price_entry['Value'] = randint(min_price, max_price)
                             modification_count += 1
                     
                     if original_count > 0:
                         print(f"  Export {export_idx}: Randomized {original_count} prices in OverridePrice_Array")
     
     print(f"\n[*] Saving modified JSON: {json_path}")
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    # Compact output: the file is only read back by UAssetGUI fromjson
+    if orjson is not None:
+        with open(json_path, 'wb') as f:
+            f.write(orjson.dumps(data))
+    else:
+        with open(json_path, 'w', encoding='utf-8') as f:
+            # Just loaded, so acyclic: skip the circular-reference bookkeeping too
+            json.dump(data, f, separators=(',', ':'), ensure_ascii=False, check_circular=False)
     
     print(f"  ✓ Modified {modification_count} total price values")
     return modification_count